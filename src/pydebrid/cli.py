@@ -11,7 +11,13 @@ from rich.table import Table
 
 from pydebrid.client import Client
 from pydebrid.progress import torrent_table, detailed_torrent_table
-from pydebrid.utils import clean_directory_filenames
+from pydebrid.utils import (
+    clean_directory_filenames,
+    cursor_path,
+    iter_links,
+    read_cursor,
+    write_cursor,
+)
 
 API_TOKEN = os.environ.get("RD_KEY")
 
@@ -118,6 +124,25 @@ async def cli_hoster_download(
     await client.batch_hoster_download(links, str(save_path))
 
 
+async def cli_hoster_stream(
+    file_data: Path, save_path: Path, n: Optional[int] = None, window: int = 8
+):
+    if not save_path.exists():
+        raise ValueError("Save path does not exist")
+
+    cpath = cursor_path(file_data)
+    links = iter_links(file_data, read_cursor(cpath))
+    if n:
+        links = islice(links, n)
+
+    async for lineno, error, cursor in client.stream_hoster_download(
+        links, str(save_path), window
+    ):
+        if error:
+            console.print(f"Line {lineno + 1}: {error}")
+        write_cursor(cpath, cursor)
+
+
 app = typer.Typer()
 
 
@@ -161,11 +186,18 @@ def hoster(
     file_data: Path = typer.Argument(..., help="File containing hoster links"),
     save_path: Path = typer.Argument(..., help="Path to save downloaded files"),
     n: Optional[int] = typer.Option(None, help="Number of downloads to start"),
+    stream: bool = typer.Option(
+        False, help="Read links lazily and resume from the last saved cursor"
+    ),
+    window: int = typer.Option(8, min=1, help="Max links in flight when streaming"),
 ):
     """
     Download files from hoster links
     """
-    asyncio.run(cli_hoster_download(file_data, save_path, n))
+    if stream:
+        asyncio.run(cli_hoster_stream(file_data, save_path, n, window))
+    else:
+        asyncio.run(cli_hoster_download(file_data, save_path, n))
 
 
 @app.command()
@@ -1,4 +1,6 @@
 import asyncio
+from collections.abc import AsyncIterator, Iterable
+from itertools import islice
 from pathlib import Path
 
 import httpx
@@ -66,7 +68,9 @@ class Client(httpx.AsyncClient):
         )
         return r
 
-    async def download(self, link_data: LinkData, savepath: str) -> None:
+    async def download(
+        self, link_data: LinkData, savepath: str, transient: bool = False
+    ) -> None:
         async with self.sem:
             headers = {
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
@@ -93,13 +97,17 @@ class Client(httpx.AsyncClient):
             chunk_size = 1024 * 1024
             task_id = self.progress.add_task(fname, total_size)
 
-            async with self.stream("GET", dlink, headers=headers) as r:
-                if r.status_code != 200:
-                    raise ValueError(f"Error: {r.status_code}")
-                async with aiofiles.open(spath, "wb") as f:
-                    async for chunk in r.aiter_raw(chunk_size=chunk_size):
-                        await f.write(chunk)
-                        self.progress.update_task(task_id, len(chunk))
+            try:
+                async with self.stream("GET", dlink, headers=headers) as r:
+                    if r.status_code != 200:
+                        raise ValueError(f"Error: {r.status_code}")
+                    async with aiofiles.open(spath, "wb") as f:
+                        async for chunk in r.aiter_raw(chunk_size=chunk_size):
+                            await f.write(chunk)
+                            self.progress.update_task(task_id, len(chunk))
+            finally:
+                if transient:
+                    self.progress.remove_task(task_id)
             if r.status_code == 200:
                 link_data.downloaded = True
 
@@ -149,6 +157,49 @@ class Client(httpx.AsyncClient):
         await asyncio.gather(*[self.download(link, savepath=savepath) for link in r])
         self.progress.stop_live_display()
 
+    async def hoster_download(
+        self, link: str, savepath: str, transient: bool = False
+    ) -> None:
+        link_data = await self.unrestrict(link)
+        await self.download(link_data, savepath=savepath, transient=transient)
+
+    async def stream_hoster_download(
+        self, links: Iterable[tuple[int, str]], savepath: str, window: int = 8
+    ) -> AsyncIterator[tuple[int, BaseException | None, int]]:
+        """
+        Unrestrict and download (line number, link) pairs with at most `window` in flight.
+
+        Links are pulled from the iterable only as slots free up, so memory stays
+        bounded by the window rather than the length of the input. After each link
+        finishes, yields (line number, error or None, cursor) where cursor is the
+        first line number not yet finished; every line before it has been attempted.
+        """
+        links = iter(links)
+        pending: dict[asyncio.Task, int] = {}
+        next_line = 0
+        self.progress.start_live_display()
+        try:
+            while True:
+                for lineno, link in islice(links, window - len(pending)):
+                    task = asyncio.create_task(
+                        self.hoster_download(link, savepath, transient=True)
+                    )
+                    pending[task] = lineno
+                    next_line = lineno + 1
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    lineno = pending.pop(task)
+                    cursor = min(pending.values(), default=next_line)
+                    yield lineno, task.exception(), cursor
+        finally:
+            for task in pending:
+                task.cancel()
+            self.progress.stop_live_display()
+
     async def batch_tinfo(self, tids: list):
         return await asyncio.gather(*[self.get_tinfo(tid) for tid in tids])
 
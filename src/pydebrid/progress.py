@@ -53,15 +53,6 @@ class JobTracker:
         self.table.add_column("ID", justify="right", style="cyan", no_wrap=True)
         self.table.add_column("Progress", justify="right", style="magenta")
         self.table.add_column("Status", style="green")
-
-    def add_task(self, description: str, total: int) -> TaskID:
-        task_id = self.progress.add_task(
-            description=description,
-            total=total,
-            status="Downloading",
-            filename=description,
-        )
-
         self.table.add_row(
             Panel.fit(
                 self.progress,
@@ -70,11 +61,22 @@ class JobTracker:
                 padding=(1, 2),
             )
         )
+
+    def add_task(self, description: str, total: int) -> TaskID:
+        task_id = self.progress.add_task(
+            description=description,
+            total=total,
+            status="Downloading",
+            filename=description,
+        )
         return task_id
 
     def update_task(self, task_id: TaskID, progress_amount: float):
         self.progress.advance(task_id, progress_amount)
 
+    def remove_task(self, task_id: TaskID):
+        self.progress.remove_task(task_id)
+
     def start_live_display(self):
         self.live.start()
 
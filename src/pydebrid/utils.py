@@ -1,5 +1,6 @@
 import re
 from re import Match
+from itertools import islice
 from pathlib import Path
 
 import httpx
@@ -16,6 +17,37 @@ def number_set_generator(snum: str) -> Generator:
             yield int(part)
 
 
+def iter_links(fpath: Path, start: int = 0) -> Generator:
+    """
+    Lazily yield (line number, link) pairs from a links file, skipping blank lines.
+
+    Args:
+        fpath: Path to the file containing one link per line
+        start: Zero-based line number to resume from
+    """
+    with open(fpath, "r") as f:
+        for lineno, line in enumerate(islice(f, start, None), start):
+            link = line.strip()
+            if link:
+                yield lineno, link
+
+
+def cursor_path(fpath: Path) -> Path:
+    return fpath.with_name(f"{fpath.name}.cursor")
+
+
+def read_cursor(fpath: Path) -> int:
+    if not fpath.exists():
+        return 0
+    return int(fpath.read_text().strip() or 0)
+
+
+def write_cursor(fpath: Path, cursor: int) -> None:
+    tmp_path = fpath.with_name(f"{fpath.name}.tmp")
+    tmp_path.write_text(str(cursor))
+    tmp_path.replace(fpath)
+
+
 def get_jav_info(dvd_id: str) -> dict | None:
     url = f"https://bot-api.r18.dev/videos/vod/movies/detail/-/dvd_id={dvd_id}/json"
     r = httpx.get(url)